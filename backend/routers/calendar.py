@@ -166,7 +166,7 @@ async def update_calendar_task(
         raise HTTPException(status_code=404, detail="Calendar task not found")
 
     # Update task attributes - store encrypted values directly
-    task_data = task.dict(exclude_unset=True)
+    task_data = task.model_dump(exclude_unset=True)
     for key, value in task_data.items():
         setattr(db_task, key, value)
 
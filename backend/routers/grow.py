@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import msgspec
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Dict, Any, Optional
 from datetime import date, datetime, timedelta
@@ -13,7 +16,12 @@ from backend.schemas.grow import (
     BulkGrowUpdate,
     BulkGrowWithIoTEntities,
     BulkGrowComplete,
-    BulkGrowFlushCreate
+    BulkGrowFlushCreate,
+    GROW_LIST_ADAPTER,
+    GROW_WITH_IOT_LIST_ADAPTER,
+    GROW_COMPLETE_LIST_ADAPTER,
+    decode_bulk_grow,
+    dump_grows,
 )
 from backend.database import get_mycomize_db, engine
 from backend.security import get_current_paid_user, load_config
@@ -30,52 +38,75 @@ router = APIRouter(
 
 # Extended create schema to include flushes
 class BulkGrowCreateWithFlushes(BulkGrowCreate):
-    flushes: Optional[List[dict]] = []
+    flushes: Optional[List[dict]] = Field(default_factory=list)
 
-@router.post("/", response_model=BulkGrowSchema, status_code=status.HTTP_201_CREATED)
+# Extended update schema to include flushes
+class BulkGrowUpdateWithFlushes(BulkGrowUpdate):
+    flushes: Optional[List[dict]] = None
+
+def request_body_schema(model: type[BaseModel]) -> dict:
+    """OpenAPI request body for routes that decode their JSON body manually"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+# Path segments in msgspec error messages, e.g. "- at `$.flushes[0].harvest_date`"
+_MSGSPEC_PATH_SEGMENT = re.compile(r"\.(\w+)|\[(\d+)\]")
+
+def msgspec_error_detail(error: msgspec.DecodeError) -> List[Dict[str, Any]]:
+    """Shape a msgspec decode error like FastAPI's request validation errors"""
+    if not isinstance(error, msgspec.ValidationError):
+        return [{
+            "type": "json_invalid",
+            "loc": ["body"],
+            "msg": "JSON decode error",
+            "ctx": {"error": str(error)},
+        }]
+
+    message, _, path = str(error).partition(" - at `$")
+    loc: List[Any] = ["body"]
+    for key, index in _MSGSPEC_PATH_SEGMENT.findall(path):
+        loc.append(key if key else int(index))
+    return [{"type": "value_error", "loc": loc, "msg": message}]
+
+def decode_grow_request(body: bytes) -> dict:
+    """Decode an encrypted grow payload with msgspec instead of pydantic"""
+    try:
+        return decode_bulk_grow(body)
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=msgspec_error_detail(e)
+        )
+
+@router.post(
+    "/",
+    response_model=BulkGrowSchema,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=request_body_schema(BulkGrowCreateWithFlushes),
+)
 async def create_grow(
-    grow: BulkGrowCreateWithFlushes,
+    request: Request,
     db: Session = Depends(get_mycomize_db),
     current_user: User = Depends(get_current_paid_user)
 ):
     """Create a new grow for the current user"""
-    # Create the grow
-    db_grow = BulkGrow(
-        name=grow.name,
-        description=grow.description,
-        species=grow.species,
-        variant=grow.variant,
-        location=grow.location,
-        tags=grow.tags,
-
-        inoculation_date=grow.inoculation_date,
-        inoculation_status=grow.inoculation_status,
-        spawn_start_date=grow.spawn_start_date,
-        spawn_colonization_status=grow.spawn_colonization_status,
-        bulk_start_date=grow.bulk_start_date,
-        bulk_colonization_status=grow.bulk_colonization_status,
-        fruiting_start_date=grow.fruiting_start_date,
-        fruiting_status=grow.fruiting_status,
-        full_spawn_colonization_date=grow.full_spawn_colonization_date,
-        full_bulk_colonization_date=grow.full_bulk_colonization_date,
-        fruiting_pin_date=grow.fruiting_pin_date,
-        harvest_completion_date=grow.harvest_completion_date,
-        s2b_ratio=grow.s2b_ratio,
-
-        current_stage=grow.current_stage,
-        status=grow.status,
-        total_cost=grow.total_cost,
-        stages=grow.stages,
-        user_id=current_user.id
-    )
+    grow_data = decode_grow_request(await request.body())
+    flushes_data = grow_data.pop('flushes', None)
+
+    # Create the grow - all user fields are stored as received (encrypted)
+    db_grow = BulkGrow(**grow_data, user_id=current_user.id)
 
     db.add(db_grow)
     db.commit()
     db.refresh(db_grow)
 
     # Handle flushes if provided - store encrypted values directly
-    if grow.flushes:
-        for flush_data in grow.flushes:
+    if flushes_data:
+        for flush_data in flushes_data:
             db_flush = BulkGrowFlush(
                 bulk_grow_id=db_grow.id,
                 # Store encrypted leaf values directly without processing
@@ -99,7 +130,7 @@ async def read_grows(
 ):
     """Get all grows for the current user"""
     grows = db.query(BulkGrow).filter(BulkGrow.user_id == current_user.id).offset(skip).limit(limit).all()
-    return grows
+    return Response(content=dump_grows(GROW_LIST_ADAPTER, grows), media_type="application/json")
 
 @router.get("/with-iot", response_model=List[BulkGrowWithIoTEntities])
 async def read_grows_with_iot(
@@ -111,7 +142,7 @@ async def read_grows_with_iot(
     grows = db.query(BulkGrow).options(
         joinedload(BulkGrow.iot_entities)
     ).filter(BulkGrow.user_id == current_user.id).all()
-    return grows
+    return Response(content=dump_grows(GROW_WITH_IOT_LIST_ADAPTER, grows), media_type="application/json")
 
 @router.get("/all", response_model=List[BulkGrowComplete])
 async def read_all_grows(
@@ -124,7 +155,7 @@ async def read_all_grows(
         joinedload(BulkGrow.iot_entities),
         joinedload(BulkGrow.flushes)
     ).filter(BulkGrow.user_id == current_user.id).all()
-    return grows
+    return Response(content=dump_grows(GROW_COMPLETE_LIST_ADAPTER, grows), media_type="application/json")
 
 @router.get("/{grow_id}", response_model=BulkGrowComplete)
 async def read_grow(
@@ -144,14 +175,14 @@ async def read_grow(
     return grow
 
 
-# Extended update schema to include flushes
-class BulkGrowUpdateWithFlushes(BulkGrowUpdate):
-    flushes: Optional[List[dict]] = None
-
-@router.put("/{grow_id}", response_model=BulkGrowSchema)
+@router.put(
+    "/{grow_id}",
+    response_model=BulkGrowSchema,
+    openapi_extra=request_body_schema(BulkGrowUpdateWithFlushes),
+)
 async def update_grow(
     grow_id: int,
-    grow: BulkGrowUpdateWithFlushes,
+    request: Request,
     db: Session = Depends(get_mycomize_db),
     current_user: User = Depends(get_current_paid_user)
 ):
@@ -161,7 +192,7 @@ async def update_grow(
         raise HTTPException(status_code=404, detail="Grow not found")
 
     # Update grow attributes
-    grow_data = grow.dict(exclude_unset=True)
+    grow_data = decode_grow_request(await request.body())
     
     # Handle flushes separately
     flushes_data = grow_data.pop('flushes', None)
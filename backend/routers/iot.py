@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -12,6 +12,7 @@ from backend.schemas.iot import (
     IoTGatewayUpdate,
     CombinedGatewayCreateRequest,
     CombinedGatewayCreateResponse,
+    dump_iot_gateways,
 )
 from backend.schemas.iot_entity import (
     IoTEntity as IoTEntitySchema,
@@ -66,16 +67,20 @@ async def create_gateway_with_entities(
         entity_mappings = {}
         created_entities = []
         
-        for entity_data in request.entities:
-            # Verify linked grow exists if specified
-            if entity_data.linked_grow_id:
-                grow = db.query(BulkGrow).filter(
-                    BulkGrow.id == entity_data.linked_grow_id, 
+        # Verify all linked grows exist in one query rather than one per entity
+        linked_grow_ids = {e.linked_grow_id for e in request.entities if e.linked_grow_id}
+        if linked_grow_ids:
+            owned_grow_ids = {
+                grow_id for (grow_id,) in db.query(BulkGrow.id).filter(
+                    BulkGrow.id.in_(linked_grow_ids),
                     BulkGrow.user_id == current_user.id
-                ).first()
-                if not grow:
+                )
+            }
+            for entity_data in request.entities:
+                if entity_data.linked_grow_id and entity_data.linked_grow_id not in owned_grow_ids:
                     raise HTTPException(status_code=404, detail=f"Grow {entity_data.linked_grow_id} not found")
-            
+
+        for entity_data in request.entities:
             # Create entity with pre-set linking
             db_entity = IoTEntity(
                 gateway_id=db_gateway.id,
@@ -161,7 +166,7 @@ async def read_iot_gateways(
 ):
     """Get all IoT gateways for the current user"""
     gateways = db.query(IoTGateway).filter(IoTGateway.user_id == current_user.id).offset(skip).limit(limit).all()
-    return gateways
+    return Response(content=dump_iot_gateways(gateways), media_type="application/json")
 
 @router.get("/{gateway_id}", response_model=IoTGatewaySchema)
 async def read_iot_gateway(
@@ -505,7 +510,7 @@ async def update_entity(
         raise HTTPException(status_code=404, detail="Entity not found")
     
     # Update entity attributes
-    entity_data = entity_update.dict(exclude_unset=True)
+    entity_data = entity_update.model_dump(exclude_unset=True)
     for key, value in entity_data.items():
         setattr(db_entity, key, value)
     
@@ -555,7 +560,7 @@ async def update_iot_gateway(
         raise HTTPException(status_code=404, detail="IoT gateway not found")
     
     # Update gateway attributes
-    gateway_data = gateway.dict(exclude_unset=True)
+    gateway_data = gateway.model_dump(exclude_unset=True)
     for key, value in gateway_data.items():
         setattr(db_gateway, key, value)
     
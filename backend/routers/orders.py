@@ -1,11 +1,11 @@
 import math
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.models.order import Order
 from backend.models.user import User
-from backend.schemas.order import OrderResponse, OrderListResponse
+from backend.schemas.order import OrderResponse, OrderListResponse, ORDER_RESPONSE_LIST_ADAPTER
 from backend.database import get_mycomize_db
 from backend.security import get_current_paid_user
 
@@ -69,15 +69,16 @@ async def get_orders(
         pages = math.ceil(total / size) if total > 0 else 1
         
         # Convert orders to response models
-        order_responses = [OrderResponse.model_validate(order) for order in orders]
+        order_responses = ORDER_RESPONSE_LIST_ADAPTER.validate_python(orders, from_attributes=True)
         
-        return OrderListResponse(
+        order_list = OrderListResponse(
             orders=order_responses,
             total=total,
             page=page,
             size=size,
             pages=pages
         )
+        return Response(content=order_list.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         print(f"Error retrieving orders for user {current_user.id}: {str(e)}")
@@ -114,7 +115,10 @@ async def get_order_by_id(
                 detail="Order not found"
             )
         
-        return OrderResponse.model_validate(order)
+        return Response(
+            content=OrderResponse.from_orm_fast(order).model_dump_json(),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, desc, asc, func
 from typing import List, Optional
@@ -12,6 +12,8 @@ from backend.schemas.tek import (
     BulkGrowTek as BulkGrowTekSchema,
     BulkGrowTekCreate,
     BulkGrowTekUpdate,
+    BulkGrowTekListItem,
+    TEK_LIST_ENCODER,
 )
 from backend.security import get_current_paid_user
 
@@ -62,9 +64,9 @@ async def get_all_teks(
             "user_has_imported": engagement_state["user_has_imported"],
             "is_owner": tek.created_by == current_user.id,
         }
-        result.append(BulkGrowTekSchema(**tek_dict))
+        result.append(BulkGrowTekListItem(**tek_dict))
 
-    return result
+    return Response(content=TEK_LIST_ENCODER.encode(result), media_type="application/json")
 
 @router.post("/", response_model=BulkGrowTekSchema)
 async def create_tek(
@@ -73,7 +75,7 @@ async def create_tek(
     current_user: User = Depends(get_current_paid_user)
 ):
     """Create a new bulk_grow tek"""
-    tek_dict = tek_data.dict()
+    tek_dict = tek_data.model_dump()
     tek_dict["created_by"] = current_user.id
     tek = BulkGrowTek(**tek_dict)
 
@@ -111,7 +113,10 @@ async def create_tek(
         "is_owner": True,  # Creator is always owner
     }
 
-    return BulkGrowTekSchema(**result_dict)
+    # Built from trusted DB values; returning a Response skips validation both
+    # here and in FastAPI's response_model handling
+    tek_response = BulkGrowTekSchema.model_construct(**result_dict)
+    return Response(content=tek_response.model_dump_json(), media_type="application/json")
 
 @router.get("/{tek_id}", response_model=BulkGrowTekSchema)
 async def get_tek(
@@ -166,7 +171,8 @@ async def get_tek(
         "is_owner": tek.created_by == current_user.id,
     }
 
-    return BulkGrowTekSchema(**result_dict)
+    tek_response = BulkGrowTekSchema.model_construct(**result_dict)
+    return Response(content=tek_response.model_dump_json(), media_type="application/json")
 
 @router.put("/{tek_id}", response_model=BulkGrowTekSchema)
 async def update_tek(
@@ -185,7 +191,7 @@ async def update_tek(
         raise HTTPException(status_code=403, detail="Access denied")
 
     # Update fields
-    update_data = tek_data.dict(exclude_unset=True)
+    update_data = tek_data.model_dump(exclude_unset=True)
     
     # Validate one-way public transition: once public, always public
     if 'is_public' in update_data:
@@ -231,7 +237,8 @@ async def update_tek(
         "is_owner": True,  # User updating is always owner
     }
 
-    return BulkGrowTekSchema(**result_dict)
+    tek_response = BulkGrowTekSchema.model_construct(**result_dict)
+    return Response(content=tek_response.model_dump_json(), media_type="application/json")
 
 @router.delete("/{tek_id}")
 async def delete_tek(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 # Lists of these objects are present in each bulk grow stage.
@@ -42,9 +42,9 @@ class EnvironmentalCondition(BaseModel):
     unit: str
 
 class BulkStageData(BaseModel):
-    items: List[Item] = []
-    environmental_conditions: List[EnvironmentalCondition] = []
-    tasks: List[Task] = []
+    items: List[Item] = Field(default_factory=list)
+    environmental_conditions: List[EnvironmentalCondition] = Field(default_factory=list)
+    tasks: List[Task] = Field(default_factory=list)
     notes: str = ""
 
 class BulkGrowStages(BaseModel):
@@ -1,9 +1,8 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
-from datetime import date, datetime
-from backend.schemas.iot import IoTGateway
+import msgspec
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Optional, List, Union
 from backend.schemas.iot_entity import IoTEntity
-from backend.schemas.bulk_stage import BulkGrowStages
 
 # BulkGrowFlush schemas
 class BulkGrowFlushBase(BaseModel):
@@ -23,8 +22,7 @@ class BulkGrowFlush(BulkGrowFlushBase):
     id: int
     bulk_grow_id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class BulkGrowBase(BaseModel):
     name: Optional[str] = None
@@ -62,47 +60,87 @@ class BulkGrow(BulkGrowBase):
     id: int
     user_id: int = Field(exclude=True)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class BulkGrowWithIoTEntities(BulkGrow):
     """Schema for returning a grow with its IoT entities"""
-    iot_entities: List[IoTEntity] = []
+    iot_entities: List[IoTEntity] = Field(default_factory=list)
 
 class BulkGrowWithFlushes(BulkGrow):
     """Schema for returning a grow with its flushes"""
-    flushes: List[BulkGrowFlush] = []
+    flushes: List[BulkGrowFlush] = Field(default_factory=list)
 
 class BulkGrowComplete(BulkGrow):
     """Schema for returning a complete grow with all related data"""
-    iot_entities: List[IoTEntity] = []
-    flushes: List[BulkGrowFlush] = []
+    iot_entities: List[IoTEntity] = Field(default_factory=list)
+    flushes: List[BulkGrowFlush] = Field(default_factory=list)
 
-class BulkGrowUpdate(BaseModel):
+class BulkGrowUpdate(BulkGrowBase):
     """Schema for updating a grow"""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    species: Optional[str] = None
-    variant: Optional[str] = None
-    location: Optional[str] = None
-    tags: Optional[str] = None
-
-    inoculation_date: Optional[str] = None
-    inoculation_status: Optional[str] = None
-    spawn_start_date: Optional[str] = None
-    spawn_colonization_status: Optional[str] = None
-    bulk_start_date: Optional[str] = None
-    bulk_colonization_status: Optional[str] = None
-    fruiting_start_date: Optional[str] = None
-    fruiting_status: Optional[str] = None
-    full_spawn_colonization_date: Optional[str] = None
-    full_bulk_colonization_date: Optional[str] = None
-    fruiting_pin_date: Optional[str] = None
-    harvest_completion_date: Optional[str] = None
-    s2b_ratio: Optional[str] = None
-
-    current_stage: Optional[str] = None
-    status: Optional[str] = None
-    total_cost: Optional[str] = None
+    pass
 
-    stages: Optional[str] = None
+# List response adapters, built once at import. The list routes validate ORM
+# rows and serialise them to JSON in a single pydantic-core call instead of
+# going through FastAPI's per-request response_model handling.
+GROW_LIST_ADAPTER = TypeAdapter(List[BulkGrow])
+GROW_WITH_IOT_LIST_ADAPTER = TypeAdapter(List[BulkGrowWithIoTEntities])
+GROW_COMPLETE_LIST_ADAPTER = TypeAdapter(List[BulkGrowComplete])
+
+def dump_grows(adapter: TypeAdapter, rows) -> bytes:
+    """Serialise grow ORM rows to JSON with one of the list adapters"""
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+# Write-path payload for grows. Every user field arrives as client-side
+# ciphertext, so there is nothing for pydantic to coerce; msgspec decodes the
+# request body straight into this struct instead. Fields absent from the body
+# stay UNSET so updates only touch what the client sent.
+OptionalStr = Union[Optional[str], msgspec.UnsetType]
+
+class BulkGrowMsg(msgspec.Struct, frozen=True, gc=False):
+    """Encrypted grow payload for create/update requests"""
+    name: OptionalStr = msgspec.UNSET
+    description: OptionalStr = msgspec.UNSET
+    species: OptionalStr = msgspec.UNSET
+    variant: OptionalStr = msgspec.UNSET
+    location: OptionalStr = msgspec.UNSET
+    tags: OptionalStr = msgspec.UNSET
+
+    inoculation_date: OptionalStr = msgspec.UNSET
+    inoculation_status: OptionalStr = msgspec.UNSET
+    spawn_start_date: OptionalStr = msgspec.UNSET
+    spawn_colonization_status: OptionalStr = msgspec.UNSET
+    bulk_start_date: OptionalStr = msgspec.UNSET
+    bulk_colonization_status: OptionalStr = msgspec.UNSET
+    fruiting_start_date: OptionalStr = msgspec.UNSET
+    fruiting_status: OptionalStr = msgspec.UNSET
+    full_spawn_colonization_date: OptionalStr = msgspec.UNSET
+    full_bulk_colonization_date: OptionalStr = msgspec.UNSET
+    fruiting_pin_date: OptionalStr = msgspec.UNSET
+    harvest_completion_date: OptionalStr = msgspec.UNSET
+    s2b_ratio: OptionalStr = msgspec.UNSET
+
+    current_stage: OptionalStr = msgspec.UNSET
+    status: OptionalStr = msgspec.UNSET
+    total_cost: OptionalStr = msgspec.UNSET
+    stages: OptionalStr = msgspec.UNSET
+
+    flushes: Union[Optional[List[dict]], msgspec.UnsetType] = msgspec.UNSET
+
+# BulkGrowMsg repeats BulkGrowBase's fields by hand, and msgspec ignores
+# unknown keys, so a field added to one but not the other would be documented
+# yet silently dropped on writes. Fail at import instead.
+_BULK_GROW_MSG_FIELDS = set(BulkGrowMsg.__struct_fields__) - {"flushes"}
+if _BULK_GROW_MSG_FIELDS != set(BulkGrowBase.model_fields):
+    raise RuntimeError(
+        "BulkGrowMsg is out of sync with BulkGrowBase: "
+        f"{sorted(_BULK_GROW_MSG_FIELDS ^ set(BulkGrowBase.model_fields))}"
+    )
+
+def decode_bulk_grow(body: bytes) -> dict:
+    """Decode a grow request body, returning only the fields that were sent"""
+    grow = msgspec.json.decode(body, type=BulkGrowMsg)
+    return {
+        field: value
+        for field, value in msgspec.structs.asdict(grow).items()
+        if value is not msgspec.UNSET
+    }
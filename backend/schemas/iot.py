@@ -1,7 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
-from datetime import datetime
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Optional
 
 class IoTGatewayBase(BaseModel):
     # user supplied / encrypted
@@ -17,25 +15,28 @@ class IoTGatewayCreate(IoTGatewayBase):
     """Schema for creating a new IoT gateway"""
     pass
 
+# Response schemas are frozen since they are built once per request and
+# serialised; request schemas (Create/Update) stay mutable.
 class IoTGateway(IoTGatewayBase):
     """Schema for returning a IoT gateway"""
     # backend generated / plaintext
     id: int
     user_id: int = Field(exclude=True)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-class IoTGatewayUpdate(BaseModel):
+# List response adapter, built once at import
+IOT_GATEWAY_LIST_ADAPTER = TypeAdapter(list[IoTGateway])
+
+def dump_iot_gateways(rows) -> bytes:
+    """Serialise IoT gateway ORM rows to JSON in one pydantic-core call"""
+    return IOT_GATEWAY_LIST_ADAPTER.dump_json(
+        IOT_GATEWAY_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    )
+
+class IoTGatewayUpdate(IoTGatewayBase):
     """Schema for updating a IoT gateway"""
-    # user supplied / encrypted
-    name: Optional[str] = None
-    type: Optional[str] = None
-    description: Optional[str] = None
-    api_url: Optional[str] = None
-    api_key: Optional[str] = None
-    linked_entities_count: Optional[str] = None
-    linkable_entities_count: Optional[str] = None
+    pass
 
 # Combined endpoint schemas for performance optimization
 class CombinedEntityCreate(BaseModel):
@@ -57,7 +58,7 @@ class CombinedGatewayCreateRequest(BaseModel):
     gateway: IoTGatewayCreate
     
     # Entity data with pre-set links
-    entities: List[CombinedEntityCreate] = []
+    entities: list[CombinedEntityCreate] = Field(default_factory=list)
 
 class CombinedGatewayCreateResponse(BaseModel):
     """Schema for combined gateway and entity creation response"""
@@ -65,4 +66,4 @@ class CombinedGatewayCreateResponse(BaseModel):
     gateway_id: int
     
     # Mapping of entity_name to backend-assigned database ID
-    entity_mappings: Dict[str, int] = {}
+    entity_mappings: dict[str, int] = Field(default_factory=dict)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
 
 class IoTEntityBase(BaseModel):
     # User-supplied / encrypted
@@ -28,8 +28,7 @@ class IoTEntity(IoTEntityBase):
     # User-supplied / encrypted
     linked_stage: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class EntityLinkingRequest(BaseModel):
     # Backend generated plaintext
@@ -40,13 +39,13 @@ class EntityLinkingRequest(BaseModel):
 
 class BulkEntityLinkingRequest(BaseModel):
     # Backend generated plaintext
-    entity_ids: List[int]  # Database entity IDs to link
+    entity_ids: list[int]  # Database entity IDs to link
     grow_id: int
 
     # User-supplied / encrypted
     stage: str
 class BulkEntityCreateRequest(BaseModel):
-    entities: List[IoTEntityCreate]
+    entities: list[IoTEntityCreate]
 
 class BulkEntityDeleteRequest(BaseModel):
-    entity_ids: List[int]  # Database entity IDs to delete
+    entity_ids: list[int]  # Database entity IDs to delete
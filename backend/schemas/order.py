@@ -1,13 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 from typing import Optional, List
-from enum import Enum
 
-
-class PaymentMethodEnum(str, Enum):
-    """Payment method enumeration for API responses"""
-    stripe = "stripe"
-    bitcoin = "bitcoin"
+from backend.models.order import PaymentMethodEnum
 
 
 class OrderResponse(BaseModel):
@@ -24,8 +19,17 @@ class OrderResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @classmethod
+    def from_orm_fast(cls, order) -> "OrderResponse":
+        """Build from a trusted Order row without re-running validation"""
+        return cls.model_construct(**{name: getattr(order, name) for name in cls.model_fields})
+
+
+# List adapter, built once at import. Validates a page of Order rows in one
+# pydantic-core call instead of a Python loop over model_validate.
+ORDER_RESPONSE_LIST_ADAPTER = TypeAdapter(List[OrderResponse])
 
 
 class OrderCreate(BaseModel):
@@ -41,9 +45,6 @@ class OrderCreate(BaseModel):
     payment_method: PaymentMethodEnum
     payment_intent_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class OrderListResponse(BaseModel):
     """Paginated list of orders"""
@@ -52,6 +53,3 @@ class OrderListResponse(BaseModel):
     page: int = Field(..., ge=1, description="Current page number")
     size: int = Field(..., ge=1, le=100, description="Number of items per page")
     pages: int = Field(..., ge=1, description="Total number of pages")
-
-    class Config:
-        from_attributes = True
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional
 from datetime import datetime
 
 class PaymentStatusSSEEvent(BaseModel):
@@ -19,6 +19,8 @@ class PaymentStatusResponse(BaseModel):
     payment_method: Optional[str] = Field(None, description="Payment method: stripe or bitcoin")
     payment_date: Optional[datetime] = Field(None, description="Date when payment was completed")
 
+    model_config = ConfigDict(frozen=True)
+
 class CreatePaymentIntentRequest(BaseModel):
     """Request schema for creating Stripe payment intent"""
     amount: int = Field(..., description="Payment amount in cents (e.g., 1999 for $19.99)")
@@ -35,7 +37,10 @@ class StripeWebhookEvent(BaseModel):
     """Schema for Stripe webhook event validation"""
     id: str = Field(..., description="Event ID")
     type: str = Field(..., description="Event type")
-    data: dict = Field(..., description="Event data payload")
+    data: dict[str, Any] = Field(..., description="Event data payload")
+
+    # Not used by any route, so skip building the validator until first use
+    model_config = ConfigDict(defer_build=True)
 
 class PaymentUpdateRequest(BaseModel):
     """Request schema for updating payment status (webhook use)"""
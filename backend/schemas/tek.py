@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from backend.schemas.bulk_stage import BulkGrowStages
+import msgspec
+
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
 
 class BulkGrowTekBase(BaseModel):
     # These will be encrypted when is_public=False, cleartext when is_public=True
@@ -48,5 +48,38 @@ class BulkGrowTek(BulkGrowTekBase):
     user_has_imported: bool = False  # Shows if current user has imported this tek
     is_owner: bool = False  # Shows if current user owns this tek
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# Read-path row for the tek list. Each row is assembled in the router from
+# trusted DB values, so there is nothing to validate; msgspec encodes the
+# structs straight to JSON. Field order matches BulkGrowTek so the response
+# body is unchanged.
+class BulkGrowTekListItem(msgspec.Struct, frozen=True, gc=False):
+    """Tek row returned by the list endpoint"""
+    name: Optional[str]
+    description: Optional[str]
+    species: Optional[str]
+    variant: Optional[str]
+    tags: Optional[str]
+    stages: Optional[str]
+    is_public: bool
+    id: int
+    creator_name: str
+    creator_profile_image: Optional[str]
+    like_count: Optional[str]
+    view_count: Optional[str]
+    import_count: Optional[str]
+    user_has_liked: bool
+    user_has_viewed: bool
+    user_has_imported: bool
+    is_owner: bool
+
+# The struct repeats BulkGrowTek's fields by hand; fail at import if they drift
+# apart, since the list route would otherwise diverge from the documented schema
+if BulkGrowTekListItem.__struct_fields__ != tuple(BulkGrowTek.model_fields):
+    raise RuntimeError(
+        "BulkGrowTekListItem fields must match BulkGrowTek.model_fields in order: "
+        f"{BulkGrowTekListItem.__struct_fields__} != {tuple(BulkGrowTek.model_fields)}"
+    )
+
+TEK_LIST_ENCODER = msgspec.json.Encoder()
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, validator
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -6,21 +7,8 @@ class UserBase(BaseModel):
     username: str
 
 class UserCreate(UserBase):
-    password: str
-
-    @validator('password')
-    def password_strength(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        return v
-
-    @validator('username')
-    def username_validator(cls, v):
-        """Validate username"""
-        if len(v) < 3:
-            raise ValueError('Username must be at least 3 characters long')
-        return v
+    username: str = Field(min_length=3)
+    password: str = Field(min_length=8)
 
 class UserLogin(UserBase):
     password: str
@@ -29,19 +17,16 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
-class TokenData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+@dataclass(slots=True)
+class TokenData:
+    """Internal only: decoded JWT claims, never part of a request or response"""
     username: Optional[str] = None
 
 class ChangePassword(BaseModel):
     current_password: str
-    new_password: str
-
-    @validator('new_password')
-    def new_password_strength(cls, v):
-        """Validate new password strength"""
-        if len(v) < 8:
-            raise ValueError('New password must be at least 8 characters long')
-        return v
+    new_password: str = Field(min_length=8)
 
 class UserProfileImageUpdate(BaseModel):
     profile_image: str  # Base64 encoded image data
@@ -51,5 +36,4 @@ class UserResponse(UserBase):
     profile_image: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
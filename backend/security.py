@@ -1,9 +1,11 @@
 import bcrypt
 import json
 import jwt
+import logging
+import time
 
 from jwt import PyJWKClient
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -12,6 +14,8 @@ from backend.schemas.user import TokenData
 from backend.models.user import User, PaymentStatus
 from backend.database import get_mycomize_db
 
+logger = logging.getLogger(__name__)
+
 # Security configurations
 ALGORITHM = "HS256"
 TOKEN_URL = "token"
@@ -29,20 +33,30 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=TOKEN_URL)
 config = load_config()
 jwt_secret_key = config["jwt_secret_key"]
 access_token_expiration = config["access_token_expiration"]
+_ACCESS_TTL_SECONDS = access_token_expiration * 60
+bcrypt_rounds = config.get("bcrypt_rounds", 12)
+
+# bcrypt only uses the first 72 bytes of a password; newer releases raise on
+# anything longer, so clip before hashing or checking
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 def verify_password(plain_password, hashed_password):
     """Verify a password against a hash"""
-    password_utf8_enc = plain_password.encode('utf-8')
+    password_utf8_enc = plain_password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
     return bcrypt.checkpw(password_utf8_enc, hashed_password)
 
 def get_password_hash(password):
     """Hash a password"""
-    password_utf8_enc = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    password_utf8_enc = password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+    salt = bcrypt.gensalt(rounds=bcrypt_rounds)
     hashed_password = bcrypt.hashpw(password_utf8_enc, salt)
 
     return hashed_password
 
+# Checked against when the username doesn't exist, so a failed login costs one
+# bcrypt round either way and response time doesn't reveal which usernames exist
+_DUMMY_HASH = get_password_hash("dummy-password")
+
 def get_user(db: Session, username: str):
     """Get a user by username"""
     return db.query(User).filter(User.username == username).first()
@@ -50,14 +64,9 @@ def get_user(db: Session, username: str):
 def authenticate_user(db: Session, username: str, password: str):
     """Authenticate a user by username and password"""
     user = get_user(db, username)
+    password_ok = verify_password(password, user.hashed_password if user else _DUMMY_HASH)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if not verify_password(password, user.hashed_password):
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
@@ -70,10 +79,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=access_token_expiration)
+    # JWT exp is a Unix timestamp, so skip the datetime round trip
+    ttl_seconds = expires_delta.total_seconds() if expires_delta else _ACCESS_TTL_SECONDS
+    expire = int(time.time() + ttl_seconds)
 
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, jwt_secret_key, algorithm=ALGORITHM)
@@ -92,19 +100,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         username: str = payload.get("sub")
 
         if username is None:
-            print("Username not found in token payload")
+            logger.debug("Username not found in token payload")
             raise credentials_exception
 
         token_data = TokenData(username=username)
     except jwt.ExpiredSignatureError:
-        print("Token has expired")
+        logger.debug("Token has expired")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
     except jwt.InvalidTokenError:
-        print("Invalid token")
+        logger.debug("Invalid token")
         raise credentials_exception
 
     user = get_user(db, username=token_data.username)
@@ -1,14 +1,15 @@
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import msgspec
+from collections import deque
+from typing import Dict, Optional
 from sse_starlette import EventSourceResponse
 import time
-from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
-class PaymentStatusSSEEvent(BaseModel):
+class PaymentStatusSSEEvent(msgspec.Struct, kw_only=True, gc=False):
     """SSE Event for payment status updates"""
     event_type: str = "payment_status"
     payment_status: str
@@ -19,11 +20,19 @@ class PaymentStatusSSEEvent(BaseModel):
     timestamp: float
     user_id: int
 
+# Broadcast payloads are encoded once per event, not once per connection
+_event_encoder = msgspec.json.Encoder()
+PAYMENT_STATUS_EVENT_PREFIX = "event: payment_status\ndata: "
+
 class SSEConnection:
     """Represents a single SSE connection"""
-    def __init__(self, user_id: int, queue: asyncio.Queue):
+    # Oldest messages are dropped if a client stops reading
+    MAX_BUFFERED_MESSAGES = 256
+
+    def __init__(self, user_id: int):
         self.user_id = user_id
-        self.queue = queue
+        self.buffer: deque = deque(maxlen=self.MAX_BUFFERED_MESSAGES)
+        self.wake = asyncio.Event()
         self.created_at = time.time()
         self.last_activity = time.time()
 
@@ -31,33 +40,32 @@ class SSEManager:
     """Manages Server-Sent Event connections and broadcasting"""
     
     def __init__(self):
-        self.connections: Dict[int, List[SSEConnection]] = {}
+        # user_id -> {id(connection): connection}, so removal is O(1)
+        self.connections: Dict[int, Dict[int, SSEConnection]] = {}
         self.cleanup_task: Optional[asyncio.Task] = None
         
-    async def add_connection(self, user_id: int, queue: asyncio.Queue) -> None:
+    async def add_connection(self, user_id: int) -> SSEConnection:
         """Add a new SSE connection for a user"""
-        if user_id not in self.connections:
-            self.connections[user_id] = []
-        
-        connection = SSEConnection(user_id, queue)
-        self.connections[user_id].append(connection)
+        connection = SSEConnection(user_id)
+        self.connections.setdefault(user_id, {})[id(connection)] = connection
         
         logger.info(f"Added SSE connection for user {user_id}. Total connections: {len(self.connections[user_id])}")
         
         # Start cleanup task if not already running
         if self.cleanup_task is None:
             self.cleanup_task = asyncio.create_task(self._cleanup_stale_connections())
+
+        return connection
     
     async def remove_connection(self, user_id: int, connection: SSEConnection) -> None:
         """Remove a specific SSE connection"""
         if user_id in self.connections:
-            try:
-                self.connections[user_id].remove(connection)
-                if not self.connections[user_id]:
-                    del self.connections[user_id]
-                logger.info(f"Removed SSE connection for user {user_id}")
-            except ValueError:
+            if self.connections[user_id].pop(id(connection), None) is None:
                 logger.warning(f"Connection not found for user {user_id}")
+                return
+            if not self.connections[user_id]:
+                del self.connections[user_id]
+            logger.info(f"Removed SSE connection for user {user_id}")
     
     async def broadcast_payment_status(self, user_id: int, payment_status: str, 
                                      payment_method: str, payment_intent_id: str,
@@ -78,19 +86,16 @@ class SSEManager:
             user_id=user_id
         )
         
-        event_data = {
-            "event": "payment_status",
-            "data": event.dict()
-        }
+        message = PAYMENT_STATUS_EVENT_PREFIX + _event_encoder.encode(event).decode() + "\n\n"
         
         logger.info(f"Broadcasting payment status '{payment_status}' to {len(self.connections[user_id])} connections for user {user_id}")
         
         # Send to all connections for this user
         stale_connections = []
-        for connection in self.connections[user_id]:
+        for connection in self.connections[user_id].values():
             try:
                 # Send the event data
-                await self._send_event_to_connection(connection, event_data)
+                await self._send_event_to_connection(connection, message)
                 connection.last_activity = time.time()
             except Exception as e:
                 logger.error(f"Error sending SSE event to user {user_id}: {e}")
@@ -100,15 +105,13 @@ class SSEManager:
         for connection in stale_connections:
             await self.remove_connection(user_id, connection)
     
-    async def _send_event_to_connection(self, connection: SSEConnection, event_data: Dict[str, Any]) -> None:
-        """Send event data to a specific connection"""
+    async def _send_event_to_connection(self, connection: SSEConnection, message: str) -> None:
+        """Send a pre-formatted SSE message to a specific connection"""
         try:
-            # Format as SSE message
-            message = f"event: {event_data['event']}\ndata: {json.dumps(event_data['data'])}\n\n"
-            
-            # Send to the connection's queue
-            logger.debug(f"Queuing event for user {connection.user_id}: {event_data['event']}")
-            await connection.queue.put(message)
+            # Buffer on the connection and wake its generator
+            logger.debug(f"Queuing event for user {connection.user_id}")
+            connection.buffer.append(message)
+            connection.wake.set()
         except Exception as e:
             logger.error(f"Failed to send event to connection for user {connection.user_id}: {e}")
             raise
@@ -123,7 +126,7 @@ class SSEManager:
                 
                 for user_id in list(self.connections.keys()):
                     stale_connections = []
-                    for connection in self.connections[user_id]:
+                    for connection in self.connections[user_id].values():
                         if current_time - connection.last_activity > stale_threshold:
                             stale_connections.append(connection)
                     
@@ -139,21 +142,10 @@ class SSEManager:
     
     async def create_event_generator(self, user_id: int):
         """Create an async generator for SSE events"""
-        queue = asyncio.Queue()
         manager = self  # Capture reference to self for the generator
         
         # Add this connection to our manager first
-        connection = SSEConnection(user_id, queue)
-        if user_id not in self.connections:
-            self.connections[user_id] = []
-        
-        self.connections[user_id].append(connection)
-        
-        logger.info(f"Added SSE connection for user {user_id}. Total connections: {len(self.connections[user_id])}")
-        
-        # Start cleanup task if not already running
-        if self.cleanup_task is None:
-            self.cleanup_task = asyncio.create_task(self._cleanup_stale_connections())
+        connection = await self.add_connection(user_id)
         
         async def event_generator():
             try:
@@ -164,15 +156,19 @@ class SSEManager:
                 }
                 yield f"event: connected\ndata: {json.dumps(initial_event['data'])}\n\n"
                 
-                # Keep connection alive and process queued messages
+                # Keep connection alive and process buffered messages
                 while True:
                     try:
                         # Wait for messages with timeout for keepalive
-                        message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                        yield message
+                        await asyncio.wait_for(connection.wake.wait(), timeout=30.0)
                     except asyncio.TimeoutError:
                         # Send keepalive ping
                         yield "event: ping\ndata: {}\n\n"
+                        continue
+
+                    connection.wake.clear()
+                    while connection.buffer:
+                        yield connection.buffer.popleft()
                         
             except asyncio.CancelledError:
                 logger.info(f"SSE connection cancelled for user {user_id}")
@@ -191,7 +187,7 @@ class SSEManager:
     def get_connection_count(self, user_id: Optional[int] = None) -> int:
         """Get the number of active connections"""
         if user_id:
-            return len(self.connections.get(user_id, []))
+            return len(self.connections.get(user_id, {}))
         return sum(len(connections) for connections in self.connections.values())
 
 # Global SSE manager instance
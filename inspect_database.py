@@ -4,22 +4,50 @@ Database inspection script for Mycomize SQLite database.
 This script allows you to inspect the raw database contents to verify encryption is working properly.
 """
 
+import re
 import sqlite3
 import sys
 import argparse
-from typing import Dict, List, Any 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime
 
 # Encryption prefixes/patterns to identify encrypted fields
 ENCRYPTION_INDICATORS = [
     'enc_v1:',  # Versioned encryption prefix
 ]
+_ENC_PREFIXES = tuple(ENCRYPTION_INDICATORS)
 
-def connect_to_database(db_path: str = "./backend/data/mycomize.db") -> sqlite3.Connection:
+# Long base64-looking strings (more than 50 characters). The length gate and
+# the character check run together in the regex engine
+_B64_RE = re.compile(r'\A[A-Za-z0-9+/=]{51,}\Z')
+
+# Read-only tuning for inspection runs. Journal and sync settings are left
+# alone since the app may have the same database open for writing.
+FAST_READ_PRAGMAS = (
+    "PRAGMA query_only = 1;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",  # 64 MiB page cache
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB memory-mapped I/O
+)
+
+# Fixed query text with bound parameters, so sqlite3's statement cache reuses
+# the prepared statement instead of re-parsing a freshly formatted string
+SQL_TEK_LIKES = "SELECT * FROM tek_likes WHERE user_id = ? ORDER BY created_at DESC LIMIT ?;"
+SQL_TEK_VIEWS = "SELECT * FROM tek_views WHERE user_id = ? ORDER BY created_at DESC LIMIT ?;"
+SQL_TEK_IMPORTS = "SELECT * FROM tek_imports WHERE user_id = ? ORDER BY created_at DESC LIMIT ?;"
+ENGAGEMENT_LIMIT = 10
+
+def connect_to_database(db_path: str = "./backend/data/mycomize.db", fast: bool = True) -> sqlite3.Connection:
     """Connect to the SQLite database."""
     try:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row  # This makes rows accessible by column name
+        if fast:
+            for pragma in FAST_READ_PRAGMAS:
+                conn.execute(pragma)
         return conn
     except sqlite3.Error as e:
         print(f"Error connecting to database: {e}")
@@ -52,45 +80,57 @@ def is_likely_encrypted(value: str) -> bool:
         return False
     
     # Check for encryption prefixes
-    for indicator in ENCRYPTION_INDICATORS:
-        if value.startswith(indicator):
-            return True
+    if value.startswith(_ENC_PREFIXES):
+        return True
     
     # Check if it looks like base64 (common in encryption)
-    # Base64 encoded strings are typically longer and contain specific characters
-    if len(value) > 20 and all(c.isalnum() or c in '+/=' for c in value):
-        # Additional heuristic: if it's very long and looks random, likely encrypted
-        if len(value) > 50:
-            return True
-    
-    return False
+    # Heuristic: only very long base64-looking strings count as encrypted
+    return _B64_RE.match(value) is not None
+
+def iter_rows(cursor: sqlite3.Cursor, batch_size: int = 256):
+    """Yield rows from a cursor in fetchmany batches instead of one fetchall."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
 
 def format_field_value(value: Any, max_length: int = 50) -> str:
     """Format a field value for display, truncating long values."""
     if value is None:
         return "NULL"
     
+    # Text is the common case; slice it directly rather than copying via str()
+    if type(value) is str:
+        return value if len(value) <= max_length else value[:max_length] + "..."
+    
     str_value = str(value)
     if len(str_value) <= max_length:
         return str_value
     
     return str_value[:max_length] + "..."
 
-def analyze_encryption_status(row: sqlite3.Row) -> Dict[str, str]:
-    """Analyze which fields in a row appear to be encrypted."""
-    analysis = {}
-    for key in row.keys():
-        value = row[key]
-        if isinstance(value, str):
-            if is_likely_encrypted(value):
-                analysis[key] = "[ENCRYPTED]"
-            else:
-                analysis[key] = "[CLEARTEXT]"
-        elif value is None:
-            analysis[key] = "[NULL]"
-        else:
-            analysis[key] = f"[{type(value).__name__.upper()}]"
-    return analysis
+# Status labels for the non-text values sqlite3 hands back
+_TYPE_LABELS = {int: '[INT]', float: '[FLOAT]', bool: '[BOOL]', bytes: '[BYTES]', bytearray: '[BYTEARRAY]'}
+
+def encryption_status(value: Any) -> str:
+    """Status label for a single field value."""
+    if type(value) is str:
+        # Strings under 10 chars are never classed as encrypted
+        if len(value) >= 10 and is_likely_encrypted(value):
+            return "[ENCRYPTED]"
+        return "[CLEARTEXT]"
+    if value is None:
+        return "[NULL]"
+    return _TYPE_LABELS.get(type(value)) or f"[{type(value).__name__.upper()}]"
+
+def analyze_encryption_status(row: sqlite3.Row, keys: Optional[Tuple[str, ...]] = None) -> Dict[str, str]:
+    """Analyze which fields in a row appear to be encrypted.
+    
+    Callers looping over a result set can pass the column names once as keys
+    rather than having row.keys() build a new list for every row.
+    """
+    return {key: encryption_status(row[key]) for key in (row.keys() if keys is None else keys)}
 
 def list_users(conn: sqlite3.Connection) -> None:
     """List all users in the database."""
@@ -126,11 +166,10 @@ def inspect_user_profile(conn: sqlite3.Connection, user_id: int = None) -> None:
             continue
             
         print(f"\n** User {user['id']} (@{user['username']}) **")
-        analysis = analyze_encryption_status(user)
         
         # Show profile image status specifically
         if user['profile_image']:
-            profile_status = analysis.get('profile_image', '[UNKNOWN]')
+            profile_status = analyze_encryption_status(user).get('profile_image', '[UNKNOWN]')
             print(f"  Profile Image Status: {profile_status}")
             print(f"  Profile Image Length: {len(user['profile_image'])} characters")
             print(f"  Profile Image Preview: {format_field_value(user['profile_image'], 50)}")
@@ -163,6 +202,9 @@ def get_system_fields() -> List[str]:
         'username', 'hashed_password'
     ]
 
+# Built once; categorize_fields checks result columns against it
+SYSTEM_FIELDS = frozenset(get_system_fields())
+
 def get_expected_model_fields() -> Dict[str, Dict[str, List[str]]]:
     """Get expected field categorization for each model based on current backend models.
     
@@ -273,22 +315,45 @@ def validate_model_synchronization(conn: sqlite3.Connection) -> None:
         except sqlite3.Error as e:
             print(f"[ERROR] {table_name.upper()}: Database error - {e}")
 
-def categorize_fields(row: sqlite3.Row) -> Dict[str, List[str]]:
-    """Categorize fields into system vs user data fields."""
-    system_fields = get_system_fields()
+def categorize_fields(field_names: Iterable[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split column names into sorted (system, user data) field tuples."""
+    system, user_data = [], []
+    for field_name in field_names:
+        (system if field_name in SYSTEM_FIELDS else user_data).append(field_name)
     
-    categorized = {
-        'system': [],
-        'user_data': []
-    }
-    
-    for field_name in row.keys():
-        if field_name in system_fields:
-            categorized['system'].append(field_name)
-        else:
-            categorized['user_data'].append(field_name)
+    return tuple(sorted(system)), tuple(sorted(user_data))
+
+def column_index(cursor: sqlite3.Cursor) -> Dict[str, int]:
+    """Map each result column name to its position in a plain tuple row."""
+    return {col[0]: i for i, col in enumerate(cursor.description)}
+
+def print_row_grouped(row: Tuple[Any, ...], user_data_fields: Tuple[str, ...], system_fields: Tuple[str, ...],
+                      field_index: Dict[str, int], user_data_note: str = "") -> None:
+    """Print a row's user data fields, then its system fields, with encryption status.
     
-    return categorized
+    The field tuples come from categorize_fields once per result set, since every
+    row of a query has the same columns. Rows are plain tuples indexed through
+    field_index rather than sqlite3.Row name lookups.
+    """
+    lines = []
+    
+    # Show user data fields first (these should be encrypted)
+    if user_data_fields:
+        lines.append("  USER DATA FIELDS:")
+        for field in user_data_fields:
+            raw_value = row[field_index[field]]
+            lines.append(f"    {field:25}: {encryption_status(raw_value):15} | {format_field_value(raw_value)}{user_data_note}")
+    
+    # Show system fields (these should be cleartext)
+    if system_fields:
+        lines.append("  SYSTEM FIELDS:")
+        for field in system_fields:
+            raw_value = row[field_index[field]]
+            lines.append(f"    {field:25}: {encryption_status(raw_value):15} | {format_field_value(raw_value)}")
+    
+    # One write per row instead of one print per field
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def inspect_user_data(conn: sqlite3.Connection, user_id: int) -> None:
     """Inspect all data for a specific user."""
@@ -304,257 +369,159 @@ def inspect_user_data(conn: sqlite3.Connection, user_id: int) -> None:
     
     print(f"Username: {user[0]}")
     
+    # The per-user listings can be long, so read them as plain tuples and
+    # index columns by position instead of going through sqlite3.Row
+    row_cursor = conn.cursor()
+    row_cursor.row_factory = None
+    
     # Inspect BulkGrows
     print(f"\n--- BulkGrows for User {user_id} ---")
-    cursor.execute("SELECT * FROM bulk_grows WHERE user_id = ? ORDER BY id;", (user_id,))
-    grows = cursor.fetchall()
-    
-    if not grows:
+    row_cursor.execute("SELECT * FROM bulk_grows WHERE user_id = ? ORDER BY id;", (user_id,))
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for grow in iter_rows(row_cursor):
+        found = True
+        print(f"\n** Grow {grow[idx['id']]} **")
+        print_row_grouped(grow, user_data_fields, system_fields, idx)
+    
+    if not found:
         print("No grows found for this user.")
-    else:
-        for i, grow in enumerate(grows):
-            print(f"\n** Grow {grow['id']} **")
-            analysis = analyze_encryption_status(grow)
-            categorized = categorize_fields(grow)
-            
-            # Show user data fields first (these should be encrypted)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(grow[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(grow[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Inspect Flushes
     print(f"\n--- Flushes for User {user_id} ---")
-    cursor.execute("""
-        SELECT f.* FROM flushes f 
-        JOIN bulk_grows bg ON f.bulk_grow_id = bg.id 
-        WHERE bg.user_id = ? ORDER BY f.id;
+    row_cursor.execute("""
+        SELECT * FROM flushes
+        WHERE bulk_grow_id IN (SELECT id FROM bulk_grows WHERE user_id = ?) ORDER BY id;
     """, (user_id,))
-    flushes = cursor.fetchall()
-    
-    if not flushes:
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for flush in iter_rows(row_cursor):
+        found = True
+        print(f"\n** Flush {flush[idx['id']]} (Grow {flush[idx['bulk_grow_id']]}) **")
+        print_row_grouped(flush, user_data_fields, system_fields, idx)
+    
+    if not found:
         print("No flushes found for this user.")
-    else:
-        for flush in flushes:
-            print(f"\n** Flush {flush['id']} (Grow {flush['bulk_grow_id']}) **")
-            analysis = analyze_encryption_status(flush)
-            categorized = categorize_fields(flush)
-            
-            # Show user data fields first (these should be encrypted)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(flush[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(flush[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Inspect TEKs (Bulk Grow Teks)
     print(f"\n--- TEKs for User {user_id} ---")
-    cursor.execute("SELECT * FROM bulk_grow_teks WHERE created_by = ? ORDER BY id;", (user_id,))
-    teks = cursor.fetchall()
-    
-    if not teks:
+    row_cursor.execute("SELECT * FROM bulk_grow_teks WHERE created_by = ? ORDER BY id;", (user_id,))
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for tek in iter_rows(row_cursor):
+        found = True
+        print(f"\n** TEK {tek[idx['id']]} **")
+        # User data is cleartext on public TEKs, so flag those rows
+        public_note = " (PUBLIC TEK)" if 'is_public' in system_fields and tek[idx['is_public']] else ""
+        print_row_grouped(tek, user_data_fields, system_fields, idx, user_data_note=public_note)
+    
+    if not found:
         print("No TEKs found for this user.")
-    else:
-        for tek in teks:
-            print(f"\n** TEK {tek['id']} **")
-            analysis = analyze_encryption_status(tek)
-            categorized = categorize_fields(tek)
-            
-            # Show user data fields first (these should be encrypted unless is_public=True)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(tek[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    # Note if this is a public TEK
-                    try:
-                        public_note = " (PUBLIC TEK)" if tek['is_public'] else ""
-                    except (KeyError, IndexError):
-                        public_note = ""
-                    print(f"    {field:25}: {status:15} | {value}{public_note}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(tek[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Inspect IoT Gateways
     print(f"\n--- IoT Gateways for User {user_id} ---")
-    cursor.execute("SELECT * FROM iot_gateways WHERE user_id = ? ORDER BY id;", (user_id,))
-    gateways = cursor.fetchall()
-    
-    if not gateways:
+    row_cursor.execute("SELECT * FROM iot_gateways WHERE user_id = ? ORDER BY id;", (user_id,))
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for gateway in iter_rows(row_cursor):
+        found = True
+        print(f"\n** IoT Gateway {gateway[idx['id']]} **")
+        print_row_grouped(gateway, user_data_fields, system_fields, idx)
+    
+    if not found:
         print("No IoT Gateways found for this user.")
-    else:
-        for gateway in gateways:
-            print(f"\n** IoT Gateway {gateway['id']} **")
-            analysis = analyze_encryption_status(gateway)
-            categorized = categorize_fields(gateway)
-            
-            # Show user data fields first (these should be encrypted)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(gateway[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(gateway[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Inspect IoT Entities
     print(f"\n--- IoT Entities for User {user_id} ---")
-    cursor.execute("""
+    row_cursor.execute("""
         SELECT e.* FROM iot_entities e 
         JOIN iot_gateways g ON e.gateway_id = g.id 
         WHERE g.user_id = ? ORDER BY e.id;
     """, (user_id,))
-    entities = cursor.fetchall()
-    
-    if not entities:
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for entity in iter_rows(row_cursor):
+        found = True
+        print(f"\n** IoT Entity {entity[idx['id']]} (Gateway {entity[idx['gateway_id']]}) **")
+        print_row_grouped(entity, user_data_fields, system_fields, idx)
+    
+    if not found:
         print("No IoT Entities found for this user.")
-    else:
-        for entity in entities:
-            print(f"\n** IoT Entity {entity['id']} (Gateway {entity['gateway_id']}) **")
-            analysis = analyze_encryption_status(entity)
-            categorized = categorize_fields(entity)
-            
-            # Show user data fields first (these should be encrypted)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(entity[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(entity[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Inspect TEK Engagement Data
     print(f"\n--- TEK Engagement for User {user_id} ---")
     
     # TEK Likes
-    cursor.execute("SELECT * FROM tek_likes WHERE user_id = ? ORDER BY created_at DESC LIMIT 10;", (user_id,))
+    cursor.execute(SQL_TEK_LIKES, (user_id, ENGAGEMENT_LIMIT))
     likes = cursor.fetchall()
     if likes:
         print(f"\n** TEK Likes ({len(likes)} shown, most recent first) **")
         for like in likes:
-            analysis = analyze_encryption_status(like)
             print(f"  TEK {like['tek_id']:3} | ID: {like['id']:3} | {like['created_at']}")
     else:
         print("\n** TEK Likes: None found **")
     
     # TEK Views  
-    cursor.execute("SELECT * FROM tek_views WHERE user_id = ? ORDER BY created_at DESC LIMIT 10;", (user_id,))
+    cursor.execute(SQL_TEK_VIEWS, (user_id, ENGAGEMENT_LIMIT))
     views = cursor.fetchall()
     if views:
         print(f"\n** TEK Views ({len(views)} shown, most recent first) **")
         for view in views:
-            analysis = analyze_encryption_status(view)
             print(f"  TEK {view['tek_id']:3} | ID: {view['id']:3} | {view['created_at']}")
     else:
         print("\n** TEK Views: None found **")
     
     # TEK Imports
-    cursor.execute("SELECT * FROM tek_imports WHERE user_id = ? ORDER BY created_at DESC LIMIT 10;", (user_id,))
+    cursor.execute(SQL_TEK_IMPORTS, (user_id, ENGAGEMENT_LIMIT))
     imports = cursor.fetchall()
     if imports:
         print(f"\n** TEK Imports ({len(imports)} shown, most recent first) **")
         for import_record in imports:
-            analysis = analyze_encryption_status(import_record)
             print(f"  TEK {import_record['tek_id']:3} | ID: {import_record['id']:3} | {import_record['created_at']}")
     else:
         print("\n** TEK Imports: None found **")
     
     # Inspect Calendar Tasks
     print(f"\n--- Calendar Tasks for User {user_id} ---")
-    cursor.execute("""
-        SELECT ct.* FROM calendar_tasks ct 
-        JOIN bulk_grows bg ON ct.grow_id = bg.id 
-        WHERE bg.user_id = ? ORDER BY ct.date DESC, ct.id DESC;
+    row_cursor.execute("""
+        SELECT * FROM calendar_tasks
+        WHERE grow_id IN (SELECT id FROM bulk_grows WHERE user_id = ?) ORDER BY date DESC, id DESC;
     """, (user_id,))
-    calendar_tasks = cursor.fetchall()
-    
-    if not calendar_tasks:
+    idx = column_index(row_cursor)
+    system_fields, user_data_fields = categorize_fields(idx)
+    found = False
+    for task in iter_rows(row_cursor):
+        found = True
+        print(f"\n** Calendar Task {task[idx['id']]} (Grow {task[idx['grow_id']]}) **")
+        print_row_grouped(task, user_data_fields, system_fields, idx)
+    
+    if not found:
         print("No calendar tasks found for this user.")
-    else:
-        for task in calendar_tasks:
-            print(f"\n** Calendar Task {task['id']} (Grow {task['grow_id']}) **")
-            analysis = analyze_encryption_status(task)
-            categorized = categorize_fields(task)
-            
-            # Show user data fields first (these should be encrypted)
-            if categorized['user_data']:
-                print("  USER DATA FIELDS:")
-                for field in sorted(categorized['user_data']):
-                    value = format_field_value(task[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
-            
-            # Show system fields (these should be cleartext)
-            if categorized['system']:
-                print("  SYSTEM FIELDS:")
-                for field in sorted(categorized['system']):
-                    value = format_field_value(task[field])
-                    status = analysis.get(field, "[UNKNOWN]")
-                    print(f"    {field:25}: {status:15} | {value}")
     
     # Show engagement summary for this user
     print(f"\n--- Engagement Summary for User {user_id} ---")
     try:
-        like_count = cursor.execute("SELECT COUNT(*) FROM tek_likes WHERE user_id = ?", (user_id,)).fetchone()[0]
-        view_count = cursor.execute("SELECT COUNT(*) FROM tek_views WHERE user_id = ?", (user_id,)).fetchone()[0] 
-        import_count = cursor.execute("SELECT COUNT(*) FROM tek_imports WHERE user_id = ?", (user_id,)).fetchone()[0]
+        like_count, view_count, import_count = cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM tek_likes WHERE user_id = ?),
+                (SELECT COUNT(*) FROM tek_views WHERE user_id = ?),
+                (SELECT COUNT(*) FROM tek_imports WHERE user_id = ?)
+        """, (user_id, user_id, user_id)).fetchone()
         
         # Calendar tasks summary
         try:
-            calendar_tasks_count = cursor.execute("""
-                SELECT COUNT(*) FROM calendar_tasks ct 
-                JOIN bulk_grows bg ON ct.grow_id = bg.id 
-                WHERE bg.user_id = ?
-            """, (user_id,)).fetchone()[0]
-            pending_tasks = cursor.execute("""
-                SELECT COUNT(*) FROM calendar_tasks ct 
-                JOIN bulk_grows bg ON ct.grow_id = bg.id 
-                WHERE bg.user_id = ? AND ct.status != 'completed'
-            """, (user_id,)).fetchone()[0]
-            completed_tasks = cursor.execute("""
-                SELECT COUNT(*) FROM calendar_tasks ct 
-                JOIN bulk_grows bg ON ct.grow_id = bg.id 
-                WHERE bg.user_id = ? AND ct.status = 'completed'
-            """, (user_id,)).fetchone()[0]
+            calendar_tasks_count, pending_tasks, completed_tasks = cursor.execute("""
+                SELECT COUNT(*),
+                       COALESCE(SUM(status != 'completed'), 0),
+                       COALESCE(SUM(status = 'completed'), 0)
+                FROM calendar_tasks
+                WHERE grow_id IN (SELECT id FROM bulk_grows WHERE user_id = ?)
+            """, (user_id,)).fetchone()
             print(f"  Total Calendar Tasks: {calendar_tasks_count} (Pending: {pending_tasks}, Completed: {completed_tasks})")
         except sqlite3.Error:
             pass  # Table might not exist yet
@@ -567,8 +534,13 @@ def inspect_user_data(conn: sqlite3.Connection, user_id: int) -> None:
 
 def inspect_table_raw(conn: sqlite3.Connection, table_name: str, limit: int = 10) -> None:
     """Show raw data from a table."""
+    # Table names can't be bound as parameters, so only accept known tables
+    if table_name not in get_table_names(conn):
+        print(f"Table '{table_name}' not found. Use --tables to list available tables.")
+        return
+    
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {table_name} LIMIT {limit};")
+    cursor.execute(f'SELECT * FROM "{table_name}" LIMIT ?;', (limit,))
     rows = cursor.fetchall()
     
     if not rows:
@@ -578,67 +550,139 @@ def inspect_table_raw(conn: sqlite3.Connection, table_name: str, limit: int = 10
     print(f"\n=== RAW DATA: {table_name.upper()} (showing {len(rows)} rows) ===")
     
     # Get column names
-    columns = [description[0] for description in cursor.description]
+    columns = tuple(description[0] for description in cursor.description)
     
     for i, row in enumerate(rows):
-        print(f"\n** Row {i + 1} **")
-        analysis = analyze_encryption_status(row)
+        analysis = analyze_encryption_status(row, columns)
+        lines = [f"\n** Row {i + 1} **"]
         
         for col_name in columns:
             value = format_field_value(row[col_name], max_length=80)
             status = analysis.get(col_name, "[UNKNOWN]")
-            print(f"  {col_name:20}: {status:15} | {value}")
+            lines.append(f"  {col_name:20}: {status:15} | {value}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def encrypted_value_sql(column: str) -> str:
+    """SQL predicate mirroring is_likely_encrypted for a single column."""
+    col = f'"{column}"'
+    prefixes = " OR ".join(f"{col} GLOB '{indicator}*'" for indicator in ENCRYPTION_INDICATORS)
+    return (
+        f"(typeof({col}) = 'text' AND length({col}) >= 10 AND ({prefixes} "
+        f"OR (length({col}) > 50 AND {col} NOT GLOB '*[^A-Za-z0-9+/=]*')))"
+    )
+
+def classify_table_columns(conn: sqlite3.Connection, table_name: str):
+    """Classify every column of a table in one aggregate query.
+    
+    Returns (row_count, encrypted, cleartext, mixed) where each list holds the
+    columns whose text values are all encrypted, all cleartext, or a mix.
+    """
+    columns = [col['name'] for col in get_table_schema(conn, table_name)]
+    aggregates = ["COUNT(*)"]
+    for column in columns:
+        aggregates.append(f"COALESCE(SUM({encrypted_value_sql(column)}), 0)")
+        aggregates.append(f"COALESCE(SUM(typeof(\"{column}\") = 'text'), 0)")
+    
+    counts = conn.execute(f"SELECT {', '.join(aggregates)} FROM {table_name};").fetchone()
+    
+    encrypted, cleartext, mixed = [], [], []
+    for i, column in enumerate(columns):
+        encrypted_count = counts[1 + 2 * i]
+        cleartext_count = counts[2 + 2 * i] - encrypted_count
+        if encrypted_count and cleartext_count:
+            mixed.append(column)
+        elif encrypted_count:
+            encrypted.append(column)
+        elif cleartext_count:
+            cleartext.append(column)
+    
+    return counts[0], encrypted, cleartext, mixed
+
+SUMMARY_TABLES = ['users', 'bulk_grows', 'flushes', 'bulk_grow_teks', 'iot_gateways', 'iot_entities', 'tek_likes', 'tek_views', 'tek_imports', 'calendar_tasks']
+
+def summarize_table(conn: sqlite3.Connection, table_name: str) -> str:
+    """Build the encryption summary text for one table."""
+    lines = []
+    cursor = conn.cursor()
+    try:
+        # Classify every row in SQLite rather than sampling rows into Python
+        row_count, encrypted_fields, cleartext_fields, mixed_fields = classify_table_columns(conn, table_name)
+        
+        if not row_count:
+            return f"{table_name}: No data"
+        
+        lines.append(f"\n{table_name.upper()}:")
+        lines.append(f"  [ENCRYPTED] fields: {', '.join(encrypted_fields) if encrypted_fields else 'None'}")
+        lines.append(f"  [CLEARTEXT] fields: {', '.join(cleartext_fields) if cleartext_fields else 'None'}")
+        if mixed_fields:
+            lines.append(f"  [MIXED] fields: {', '.join(mixed_fields)}")
+        lines.append(f"  [ROWS] Total rows: {row_count}")
+        
+        # Special note for TEKs about public vs private
+        if table_name == 'bulk_grow_teks':
+            try:
+                public_count, private_count = cursor.execute("""
+                    SELECT COALESCE(SUM(is_public = 1), 0), COALESCE(SUM(is_public = 0), 0)
+                    FROM bulk_grow_teks
+                """).fetchone()
+                lines.append(f"  [TEKS] Public TEKs: {public_count}, Private TEKs: {private_count}")
+            except sqlite3.Error:
+                pass
+        
+        # Special notes for engagement tables
+        if table_name in ['tek_likes', 'tek_views', 'tek_imports']:
+            try:
+                total_count, unique_users, unique_teks = cursor.execute(
+                    f"SELECT COUNT(*), COUNT(DISTINCT user_id), COUNT(DISTINCT tek_id) FROM {table_name}"
+                ).fetchone()
+                lines.append(f"  [ENGAGEMENT] Total: {total_count}, Users: {unique_users}, TEKs: {unique_teks}")
+            except sqlite3.Error:
+                pass
+    
+    except sqlite3.Error as e:
+        lines.append(f"{table_name}: Error - {e}")
+    
+    return "\n".join(lines)
+
+def _summarize_table_readonly(db_uri: str, fast: bool, table_name: str) -> str:
+    """Summarize one table on its own read-only connection (thread pool worker)."""
+    try:
+        conn = sqlite3.connect(db_uri, uri=True)
+    except sqlite3.Error as e:
+        return f"{table_name}: Error - {e}"
+    
+    try:
+        if fast:
+            for pragma in FAST_READ_PRAGMAS:
+                conn.execute(pragma)
+        return summarize_table(conn, table_name)
+    except sqlite3.Error as e:
+        return f"{table_name}: Error - {e}"
+    finally:
+        conn.close()
 
-def show_encryption_summary(conn: sqlite3.Connection) -> None:
-    """Show a summary of encryption status across all tables."""
+def show_encryption_summary(conn: sqlite3.Connection, workers: int = 4, fast: bool = True) -> None:
+    """Show a summary of encryption status across all tables.
+    
+    Tables are summarized concurrently on separate read-only connections;
+    sqlite3 releases the GIL while a query runs. In-memory databases, or
+    workers <= 1, fall back to the given connection. fast applies the
+    read-only PRAGMAs on the worker connections, matching --fast.
+    """
     print("\n=== ENCRYPTION SUMMARY ===")
     
-    tables_to_check = ['users', 'bulk_grows', 'flushes', 'bulk_grow_teks', 'iot_gateways', 'iot_entities', 'tek_likes', 'tek_views', 'tek_imports', 'calendar_tasks']
+    db_file = conn.execute("PRAGMA database_list;").fetchone()[2]
+    if workers <= 1 or not db_file:
+        for table_name in SUMMARY_TABLES:
+            print(summarize_table(conn, table_name))
+        return
     
-    for table_name in tables_to_check:
-        cursor = conn.cursor()
-        try:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 5;")
-            rows = cursor.fetchall()
-            
-            if not rows:
-                print(f"{table_name}: No data")
-                continue
-            
-            print(f"\n{table_name.upper()}:")
-            
-            # Analyze first row to get field encryption status
-            if rows:
-                analysis = analyze_encryption_status(rows[0])
-                encrypted_fields = [k for k, v in analysis.items() if "ENCRYPTED" in v]
-                cleartext_fields = [k for k, v in analysis.items() if "CLEARTEXT" in v]
-                
-                print(f"  [ENCRYPTED] fields: {', '.join(encrypted_fields) if encrypted_fields else 'None'}")
-                print(f"  [CLEARTEXT] fields: {', '.join(cleartext_fields) if cleartext_fields else 'None'}")
-                print(f"  [ROWS] Total rows: {len(rows)}")
-                
-                # Special note for TEKs about public vs private
-                if table_name == 'bulk_grow_teks':
-                    try:
-                        if 'is_public' in rows[0].keys():
-                            public_count = cursor.execute("SELECT COUNT(*) FROM bulk_grow_teks WHERE is_public = 1").fetchone()[0]
-                            private_count = cursor.execute("SELECT COUNT(*) FROM bulk_grow_teks WHERE is_public = 0").fetchone()[0]
-                            print(f"  [TEKS] Public TEKs: {public_count}, Private TEKs: {private_count}")
-                    except (KeyError, IndexError):
-                        pass
-                
-                # Special notes for engagement tables
-                if table_name in ['tek_likes', 'tek_views', 'tek_imports']:
-                    try:
-                        total_count = cursor.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-                        unique_users = cursor.execute(f"SELECT COUNT(DISTINCT user_id) FROM {table_name}").fetchone()[0]
-                        unique_teks = cursor.execute(f"SELECT COUNT(DISTINCT tek_id) FROM {table_name}").fetchone()[0]
-                        print(f"  [ENGAGEMENT] Total: {total_count}, Users: {unique_users}, TEKs: {unique_teks}")
-                    except (KeyError, IndexError, sqlite3.Error):
-                        pass
-        
-        except sqlite3.Error as e:
-            print(f"{table_name}: Error - {e}")
+    db_uri = Path(db_file).as_uri() + "?mode=ro"
+    with ThreadPoolExecutor(max_workers=min(workers, len(SUMMARY_TABLES))) as executor:
+        # map yields results in table order, so output matches the serial run
+        for text in executor.map(partial(_summarize_table_readonly, db_uri, fast), SUMMARY_TABLES):
+            print(text)
 
 def main():
     parser = argparse.ArgumentParser(description="Inspect Mycomize SQLite database for encryption verification")
@@ -651,11 +695,18 @@ def main():
     parser.add_argument("--summary", action="store_true", help="Show encryption summary")
     parser.add_argument("--tables", action="store_true", help="List all tables")
     parser.add_argument("--validate", action="store_true", help="Validate database schema against expected models")
+    parser.add_argument("--fast", action=argparse.BooleanOptionalAction, default=True, help="Apply read-only speed PRAGMAs (default: on)")
+    parser.add_argument("--workers", type=int, default=4, help="Threads used for the encryption summary (1 = serial)")
+    parser.add_argument("--unbuffered", action="store_true", help="Flush output line by line (for interactive debugging)")
     
     args = parser.parse_args()
     
+    # Block-buffer stdout even on a terminal; reports can run to thousands of lines
+    if not args.unbuffered:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     # Connect to database
-    conn = connect_to_database(args.db)
+    conn = connect_to_database(args.db, fast=args.fast)
     
     try:
         if args.tables:
@@ -680,7 +731,7 @@ def main():
             inspect_table_raw(conn, args.table, args.limit)
         
         elif args.summary:
-            show_encryption_summary(conn)
+            show_encryption_summary(conn, args.workers, args.fast)
         
         elif args.validate:
             validate_model_synchronization(conn)
@@ -690,7 +741,7 @@ def main():
             print("Mycomize Database Inspector")
             print("=" * 50)
             validate_model_synchronization(conn)
-            show_encryption_summary(conn)
+            show_encryption_summary(conn, args.workers, args.fast)
             list_users(conn)
             print("\nUsage examples:")
             print(f"  python {sys.argv[0]} --user 1                    # Inspect user 1 data")